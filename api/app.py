@@ -17,8 +17,8 @@ from contextlib import asynccontextmanager
 import aiohttp
 from aiohttp import ClientTimeout
 from aiohttp_socks import ProxyConnector
-from Crypto.Cipher import PKCS1_v1_5
-from Crypto.PublicKey import RSA
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
 
 from pydantic import BaseModel
 
@@ -496,9 +496,9 @@ class RenphoWeight:
     @staticmethod
     def encrypt_password(public_key_str, password):
         try:
-            rsa_key = RSA.importKey(public_key_str)
-            cipher = PKCS1_v1_5.new(rsa_key)
-            return b64encode(cipher.encrypt(password.encode("utf-8"))).decode("utf-8")
+            rsa_key = load_pem_public_key(public_key_str.encode("utf-8"))
+            ciphertext = rsa_key.encrypt(password.encode("utf-8"), padding.PKCS1v15())
+            return b64encode(ciphertext).decode("utf-8")
         except Exception as e:
             _LOGGER.error(f"Encryption error: {e}")
             raise
@@ -1,24 +1,65 @@
+from __future__ import annotations
+
 import asyncio
 import logging
+from functools import partial
+from operator import itemgetter
 
-from httpcore import TimeoutException
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, async_get_hass, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.start import async_at_start
 
 from .const import (
     CONF_EMAIL,
     CONF_PASSWORD,
-    CONF_PUBLIC_KEY,
+    CONF_PROXY,
     CONF_REFRESH,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_USER_ID,
+    DATA_YAML_USER_ID,
     DOMAIN,
-    EVENT_HOMEASSISTANT_STOP,
+    MASS_KILOGRAMS,
+    MASS_POUNDS,
+    MIN_REFRESH_SECONDS,
 )
-from .api_renpho import RenphoWeight
+from .coordinator import RenphoWeightCoordinator, create_coordinator
 
 
 # Initialize logger
 _LOGGER = logging.getLogger(__name__)
 
+# Validated by Home Assistant before async_setup runs, so a bad YAML block is
+# rejected up front instead of failing half way through setup
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Required(CONF_EMAIL): cv.string,
+                vol.Required(CONF_PASSWORD): cv.string,
+                # Not bounded here: setup_renpho clamps short intervals with
+                # a warning instead of refusing to load existing configs
+                vol.Optional(CONF_REFRESH, default=60): cv.positive_int,
+                vol.Optional(CONF_UNIT_OF_MEASUREMENT, default=MASS_KILOGRAMS): vol.In(
+                    [MASS_KILOGRAMS, MASS_POUNDS]
+                ),
+                vol.Optional(CONF_USER_ID): cv.string,
+                vol.Optional(CONF_PROXY): cv.string,
+            },
+            # Keys this schema does not know about are kept rather than
+            # rejected, so existing YAML setups keep loading
+            extra=vol.ALLOW_EXTRA,
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+# Pulls the required credentials out of the config in a single C-level call
+_REQUIRED_CONF = itemgetter(CONF_EMAIL, CONF_PASSWORD)
+
 # ------------------- Setup Methods -------------------
 
 
@@ -28,12 +69,26 @@ async def async_setup(hass, config):
 
     if conf := config.get(DOMAIN):
         await setup_renpho(hass, conf)
+        # Lets the YAML sensor platform find this account's coordinator
+        hass.data[DATA_YAML_USER_ID] = user_id = conf.get(CONF_USER_ID)
+        if user_id:
+            registry = er.async_get(hass)
+            for entity_entry in list(registry.entities.values()):
+                if entity_entry.platform != DOMAIN or entity_entry.config_entry_id:
+                    continue
+                if update := _scoped_unique_id(entity_entry, user_id):
+                    registry.async_update_entity(entity_entry.entity_id, **update)
     return True
 
 
 async def async_setup_entry(hass, entry):
     """Set up Renpho from a config entry."""
-    await setup_renpho(hass, entry.data)
+    if user_id := entry.data.get(CONF_USER_ID):
+        await er.async_migrate_entries(
+            hass, entry.entry_id, partial(_scoped_unique_id, user_id=user_id)
+        )
+    # Drops the pending first fetch if the entry unloads before startup ends
+    entry.async_on_unload(await setup_renpho(hass, entry.data))
 
     hass.async_create_task(
         hass.config_entries.async_forward_entry_setup(entry, "sensor")
@@ -46,37 +101,82 @@ async def async_unload_entry(hass, entry):
     """Unload a config entry."""
     # Remove Renpho instance if it exists
     await hass.config_entries.async_forward_entry_unload(entry, "sensor")
-    if DOMAIN in hass.data:
-        del hass.data[DOMAIN]
-        return True
+    if coordinator := hass.data.get(DOMAIN, {}).pop(entry.data.get(CONF_USER_ID), None):
+        await coordinator.api.close()
+    return True
 
 
 # ------------------- Helper Methods -------------------
 
-async def setup_renpho(hass, conf):
+@callback
+def _scoped_unique_id(entity_entry: er.RegistryEntry, user_id) -> dict | None:
+    """Rewrite a pre-multi-account sensor id to the per-user form.
+
+    Sensor unique ids used to be ``renpho_<name>``; they now carry the user id
+    so accounts do not collide. Rewriting them keeps existing entities and
+    their history instead of creating duplicates.
+    """
+    prefix = f"renpho_{user_id}_"
+    if entity_entry.unique_id.startswith(prefix):
+        return None
+    return {"new_unique_id": prefix + entity_entry.unique_id.removeprefix("renpho_")}
+
+
+async def setup_renpho(hass, conf) -> CALLBACK_TYPE:
     """Common setup logic for YAML and UI."""
-    email = conf[CONF_EMAIL]
-    password = conf[CONF_PASSWORD]
+    email, password = _REQUIRED_CONF(conf)
     unit_of_measurement = conf.get(CONF_UNIT_OF_MEASUREMENT, "kg")
     user_id = conf.get(CONF_USER_ID)
     refresh = conf.get(CONF_REFRESH, 60)
-    proxy = conf.get("proxy", None)
+    if refresh < MIN_REFRESH_SECONDS:
+        _LOGGER.warning(
+            "Refresh interval %s s is below the minimum, clamping to %s s",
+            refresh, MIN_REFRESH_SECONDS,
+        )
+        refresh = MIN_REFRESH_SECONDS
+    proxy = conf.get(CONF_PROXY)
+    # Share Home Assistant's pooled session unless a proxy needs its own connector
+    session = None if proxy else async_get_clientsession(hass)
+    # Imported here so the client and its crypto/pydantic dependencies only
+    # load once the integration is actually configured
+    from .api_renpho import RenphoWeight
+
     renpho = RenphoWeight(
         email=email,
         password=password,
         user_id=user_id,
         refresh=refresh,
-        proxy=proxy
+        proxy=proxy,
+        session=session,
+    )
+    # A single coordinator per Renpho user owns the poll timer, so every sensor
+    # shares one fetch per interval. The account's settings travel with it as
+    # coordinator.config, so several accounts can run side by side
+    coordinator = create_coordinator(
+        hass, renpho, {**conf, CONF_REFRESH: refresh, CONF_UNIT_OF_MEASUREMENT: unit_of_measurement}
     )
-    hass.data[DOMAIN] = renpho
-    hass.data[CONF_EMAIL] = email
-    hass.data[CONF_USER_ID] = user_id
-    hass.data[CONF_REFRESH] = refresh
-    hass.data[CONF_UNIT_OF_MEASUREMENT] = unit_of_measurement
+    if DOMAIN not in hass.data:
+        # First account: one stop listener closes every client
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_cleanup)
+    hass.data.setdefault(DOMAIN, {})[user_id] = coordinator
+    # Fetch in the background once Home Assistant is up (or right away if it
+    # already is) so setup does not wait on the Renpho cloud. The returned
+    # callback cancels that first fetch if it has not run yet
+    return async_at_start(hass, partial(_async_prepare, coordinator))
 
-    return True
+
+async def _async_prepare(coordinator: RenphoWeightCoordinator, hass: HomeAssistant) -> None:
+    """Run the coordinator's first fetch."""
+    await coordinator.async_refresh()
 
 
+@callback
+def _async_cleanup(event: Event) -> None:
+    """Close the client's own connection pool when Home Assistant stops."""
+    hass = async_get_hass()
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        hass.async_create_task(coordinator.api.close())
+
 
 # ------------------- Main Method for Testing -------------------
 
@@ -85,6 +185,7 @@ if __name__ == "__main__":
     async def main():
         import os
         from dotenv import load_dotenv
+        from .api_renpho import RenphoWeight
 
         load_dotenv()
 
@@ -113,12 +214,6 @@ if __name__ == "__main__":
             specific_metric = await renpho.get_specific_metric('weight', 'weight')
             print(f"Fetched specific metric: {specific_metric}")
 
-            # await renpho.start_polling(refresh=1)
-            # print("Started polling.")
-
-            # await renpho.stop_polling()
-            # print("Stopped polling.")
-
             device_info = await renpho.get_device_info()
             print("Fetched device info:", device_info)
 
@@ -147,7 +242,7 @@ if __name__ == "__main__":
             print(f"An exception occurred: {e}")
 
         finally:
-            input("Press Enter to stop polling")
-            await renpho.close()  # This method also stops polling as per your class definition
+            input("Press Enter to close the session")
+            await renpho.close()
 
     asyncio.run(main())
@@ -1,17 +1,23 @@
+from __future__ import annotations
+
 import asyncio
 import datetime
+import json
 import logging
+import random
 import time
 from base64 import b64encode
-from typing import Callable, Dict, Final, List, Optional, Union
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple, Union
 
 import aiohttp
+import orjson
 from aiohttp import ClientTimeout
 from aiohttp_socks import ProxyConnector
-from Crypto.Cipher import PKCS1_v1_5
-from Crypto.PublicKey import RSA
+from cryptography.hazmat.primitives.asymmetric import padding
+from pydantic import TypeAdapter, ValidationError
+from yarl import URL
 
-from .const import CONF_PUBLIC_KEY
+from .const import GIRTH_METRICS, get_public_key
 
 METRIC_TYPE_WEIGHT: Final = "weight"
 METRIC_TYPE_GROWTH_RECORD: Final = "growth_record"
@@ -20,21 +26,56 @@ METRIC_TYPE_GIRTH_GOAL: Final = "girth_goals"
 
 from .api_object import UserResponse, DeviceBind, MeasurementDetail, Users, GirthGoal, GirthGoalsResponse, Girth, GirthResponse, MeasurementResponse
 
+# Validate whole response lists in one pydantic-core call
+_MEASUREMENTS_ADAPTER: Final = TypeAdapter(List[MeasurementDetail])
+_DEVICES_ADAPTER: Final = TypeAdapter(List[DeviceBind])
+_USERS_ADAPTER: Final = TypeAdapter(List[Users])
+
+
+_REQUEST_HEADERS: Final = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "Renpho/2.1.0 (iPhone; iOS 14.4; Scale/2.1.0; en-US)",
+}
+_REQUEST_TIMEOUT: Final = ClientTimeout(total=60)
+
+# OpenSSL-backed PKCS#1 v1.5 padding used for the password, shared by all logins
+_PKCS1V15: Final = padding.PKCS1v15()
+
+
+def _json_dumps(obj) -> str:
+    """Serialize request bodies with orjson; aiohttp expects a str."""
+    return orjson.dumps(obj).decode()
+
+
 # Initialize logging
 _LOGGER = logging.getLogger(__name__)
 
-# API Endpoints
-API_AUTH_URL = "https://renpho.qnclouds.com/api/v3/users/sign_in.json?app_id=Renpho" # Authentication Post
-API_SCALE_USERS_URL = "https://renpho.qnclouds.com/api/v3/scale_users/list_scale_user" # Scale users
-API_MEASUREMENTS_URL = "https://renpho.qnclouds.com/api/v2/measurements/list.json" # Measurements
-DEVICE_INFO_URL = "https://renpho.qnclouds.com/api/v2/device_binds/get_device.json" # Device info
-LATEST_MODEL_URL = "https://renpho.qnclouds.com/api/v3/devices/list_lastest_model.json" # Latest model
-GIRTH_URL = "https://renpho.qnclouds.com/api/v3/girths/list_girth.json" # Girth
-GIRTH_GOAL_URL = "https://renpho.qnclouds.com/api/v3/girth_goals/list_girth_goal.json" # Girth goal
-GROWTH_RECORD_URL = "https://renpho.qnclouds.com/api/v3/growth_records/list_growth_record.json" # Growth record
-MESSAGE_LIST_URL = "https://renpho.qnclouds.com/api/v2/messages/list.json" # message to support
-USER_REQUEST_URL = "https://renpho.qnclouds.com/api/v2/users/request_user.json" # error
-USERS_REACH_GOAL = "https://renpho.qnclouds.com/api/v3/users/reach_goal.json" # error 404
+# API Endpoints, parsed once so each request only has to encode its query
+API_AUTH_URL = URL("https://renpho.qnclouds.com/api/v3/users/sign_in.json?app_id=Renpho") # Authentication Post
+API_SCALE_USERS_URL = URL("https://renpho.qnclouds.com/api/v3/scale_users/list_scale_user") # Scale users
+API_MEASUREMENTS_URL = URL("https://renpho.qnclouds.com/api/v2/measurements/list.json") # Measurements
+DEVICE_INFO_URL = URL("https://renpho.qnclouds.com/api/v2/device_binds/get_device.json") # Device info
+LATEST_MODEL_URL = URL("https://renpho.qnclouds.com/api/v3/devices/list_lastest_model.json") # Latest model
+GIRTH_URL = URL("https://renpho.qnclouds.com/api/v3/girths/list_girth.json") # Girth
+GIRTH_GOAL_URL = URL("https://renpho.qnclouds.com/api/v3/girth_goals/list_girth_goal.json") # Girth goal
+GROWTH_RECORD_URL = URL("https://renpho.qnclouds.com/api/v3/growth_records/list_growth_record.json") # Growth record
+MESSAGE_LIST_URL = URL("https://renpho.qnclouds.com/api/v2/messages/list.json") # message to support
+USER_REQUEST_URL = URL("https://renpho.qnclouds.com/api/v2/users/request_user.json") # error
+USERS_REACH_GOAL = URL("https://renpho.qnclouds.com/api/v3/users/reach_goal.json") # error 404
+
+# Fixed "updated since" timestamp sent with every request (1998-01-01, local time)
+_EPOCH_TS: Final[int] = int(time.mktime(datetime.date(1998, 1, 1).timetuple()))
+
+# Girth model fields that hold a measurement, e.g. "neck_value"
+_GIRTH_VALUE_FIELDS: Final = tuple(field for field in GIRTH_METRICS if field.endswith("_value"))
+
+# Seconds a successful proxy check stays valid
+PROXY_CHECK_TTL: Final = 300
+
+# Upper bound on simultaneous requests to the Renpho API
+MAX_CONCURRENT_REQUESTS: Final = 4
 
 
 class RenphoWeight:
@@ -47,9 +88,12 @@ class RenphoWeight:
         user_id (str, optional): The ID of the user for whom weight data should be fetched.
     """
 
-    def __init__(self, email, password, user_id=None, refresh=60, proxy=None):
-        """Initialize a new RenphoWeight instance."""
-        self.public_key: str = CONF_PUBLIC_KEY
+    def __init__(self, email, password, user_id=None, refresh=60, proxy=None, session=None):
+        """Initialize a new RenphoWeight instance.
+
+        Pass ``session`` to share an existing aiohttp session (such as Home
+        Assistant's); it is then left open by close().
+        """
         self.email: str = email
         self.password: str = password
         if user_id == "":
@@ -57,8 +101,10 @@ class RenphoWeight:
         self.user_id: str = user_id
         self.refresh = refresh
         self.token: str = None
-        self.session = None
-        self.polling = False
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._connector: Optional[aiohttp.BaseConnector] = None
+        self._logged_encoding = False
         self.login_data = None
         self.users = []
         self.weight_info = None
@@ -74,133 +120,231 @@ class RenphoWeight:
         self._last_updated_weight = None
         self._last_updated_girth = None
         self._last_updated_girth_goal = None
+        self._latest_girth_by_metric: Dict[str, float] = {}
+        self._latest_girth_goal_by_type: Dict[str, float] = {}
         self._last_updated_growth_record = None
-        self.auth_in_progress = False
-        self.is_polling_active = False
+        self._auth_lock = asyncio.Lock()
         self.proxy = proxy
-
-        _LOGGER.info(f"Initializing RenphoWeight instance. Proxy is {'enabled: ' + proxy if proxy else 'disabled.'}")
+        self._proxy_ok_until: float = 0
+        self._encrypted_password: Optional[str] = None
+        self._encrypted_for: Optional[str] = None
+        self._auth_body: Optional[bytes] = None
+        self._auth_body_email: Optional[str] = None
+        self._common_params: Dict[str, str] = {"locale": "en", "app_id": "Renpho"}
+        self._fetch_sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._in_flight: Dict[tuple, asyncio.Future] = {}
+        self._etag_cache: Dict[tuple, Tuple[str, Any]] = {}
+
+        _LOGGER.info("Initializing RenphoWeight instance. Proxy: %s", proxy or "disabled")
 
     @staticmethod
     def get_timestamp() -> int:
-        start_date = datetime.date(1998, 1, 1)
-        return int(time.mktime(start_date.timetuple()))
-
-
-    def prepare_data(self, data):
-        if isinstance(data, bytes):
-            return data.decode("utf-8")
-        elif isinstance(data, dict):
-            return {key: self.prepare_data(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self.prepare_data(element) for element in data]
-        else:
-            return data
+        return _EPOCH_TS
 
     async def open_session(self):
         """
         Open a new aiohttp session if one does not exist or is closed.
         """
-        if self.session is None or self.session.closed:
-            self.token = None
-            self.session = aiohttp.ClientSession(
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
+        return await self._get_session()
+
+    def _get_connector(self) -> aiohttp.BaseConnector:
+        """
+        Return the connector for this instance, building it only when needed.
+
+        The proxy URL is parsed once per connector rather than per request.
+        Every endpoint lives on a single host, so the pool is kept small:
+        MAX_CONCURRENT_REQUESTS connections per host covers a gathered poll,
+        DNS answers are cached for ten minutes and idle connections are kept
+        alive between polls. The same limits apply to the SOCKS connector.
+        """
+        if self._connector is None or self._connector.closed:
+            pool_options = {
+                "limit": 2 * MAX_CONCURRENT_REQUESTS,
+                "limit_per_host": MAX_CONCURRENT_REQUESTS,
+                "ttl_dns_cache": 600,
+                "keepalive_timeout": 120,
+                "enable_cleanup_closed": True,
+            }
+            self._connector = (
+                ProxyConnector.from_url(self.proxy, **pool_options)
+                if self.proxy
+                else aiohttp.TCPConnector(**pool_options)
             )
-        if self.session:
-            await self.session.close()
+        return self._connector
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the aiohttp session, creating an owned one on first use.
+
+        An injected session (e.g. Home Assistant's shared client session) is
+        used as is. Otherwise the session (and its connection pool) is reused
+        for every request made by this instance and only closed in close().
+        Request headers, timeout and status handling are passed per request
+        so they apply to either kind of session.
+        """
+        if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession(
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
+                connector=self._get_connector(),
+                json_serialize=_json_dumps,
+                auto_decompress=True,
             )
+            self._owns_session = True
+        return self.session
 
     async def check_proxy(self):
         """
         Checks if the proxy is working by making a request to a Renpho API endpoint.
+
+        Without a proxy there is nothing to check, so no test request is sent.
+        A successful check is cached for PROXY_CHECK_TTL seconds so the
+        coordinator does not hit the test endpoint before every request.
         """
-        test_url = 'http://httpbin.org/get'
-    
         if not self.proxy:
-            _LOGGER.info("No proxy configured. Proceeding without proxy.")
-        else:
-            _LOGGER.info(f"Checking proxy connectivity using proxy: {self.proxy}")
-    
+            return True
+
+        test_url = 'http://httpbin.org/get'
+
+        if time.monotonic() < self._proxy_ok_until:
+            return True
+
+        _LOGGER.info("Checking proxy connectivity using proxy: %s", self.proxy)
+
         try:
-            connector = ProxyConnector.from_url(self.proxy) if self.proxy else None
-            session = aiohttp.ClientSession(connector=connector)
-            async with session.get(test_url) as response:
+            session = await self._get_session()
+            async with session.get(test_url, timeout=_REQUEST_TIMEOUT, raise_for_status=False) as response:
                 if response.status == 200:
-                    _LOGGER.info("Proxy check successful." if self.proxy else "Direct connection successful.")
+                    _LOGGER.info("Proxy check successful.")
+                    self._proxy_ok_until = time.monotonic() + PROXY_CHECK_TTL
                     return True
                 else:
-                    _LOGGER.error(f"Failed to connect using {'proxy' if self.proxy else 'direct connection'}. HTTP Status: {response.status}")
+                    _LOGGER.error("Failed to connect using proxy. HTTP Status: %s", response.status)
                     return False
         except Exception as e:
-            _LOGGER.error(f"Proxy connection failed: {e}")
+            _LOGGER.error("Proxy connection failed: %s", e)
             return False
-        finally:
-            await session.close()
 
-    async def _request(self, method: str, url: str, retries: int = 3, skip_auth=False, **kwargs):
+    async def _request(self, method: str, url: URL, retries: int = 3, skip_auth=False, **kwargs):
         """
         Perform an API request and return the parsed JSON response.
 
         Parameters:
             method (str): The HTTP method to use for the request (e.g., "GET", "POST").
-            url (str): The URL to which the request should be made.
+            url (URL): The endpoint URL to which the request should be made.
             retries (int, optional): The number of times to retry the request if it fails. Defaults to 3.
             skip_auth (bool, optional): Whether to skip authentication. Defaults to False.
-            **kwargs: Additional keyword arguments to pass to the request.
+            **kwargs: Additional keyword arguments to pass to the request. ``params`` is
+                encoded into the URL query together with the session key.
 
         Returns:
             Union[Dict, List]: The parsed JSON response from the API request.
         """
+        if method != "GET":
+            return await self._send_request(method, url, retries, skip_auth, **kwargs)
+
+        # Concurrent callers asking for the same endpoint and query share one
+        # in-flight request; keyed like the ETag cache
+        params = kwargs.get("params")
+        key = (url, tuple(params.items()) if params else None)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, url, retries, skip_auth, **kwargs))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _send_request(self, method: str, url: URL, retries: int = 3, skip_auth=False, **kwargs):
+        """
+        Send an API request, re-authenticating and retrying as needed.
+        """
         if not await self.check_proxy():
             _LOGGER.error("Proxy check failed. Aborting authentication.")
             raise APIError("Proxy check failed. Aborting authentication.")
-        while retries > 0:
-            connector = ProxyConnector.from_url(self.proxy) if self.proxy else None
-            async with aiohttp.ClientSession(connector=connector, headers={
-                            "Content-Type": "application/json",
-                            "Accept": "application/json",
-                            "User-Agent": "Renpho/2.1.0 (iPhone; iOS 14.4; Scale/2.1.0; en-US)"
-                        }, timeout=ClientTimeout(total=60)) as session:
-
-                if not self.token and not url.endswith("sign_in.json") or not skip_auth:
-                    auth_success = await self.auth()
-                    if not auth_success:
-                        raise AuthenticationError("Authentication failed. Unable to proceed with the request.")
-
-                kwargs = self.prepare_data(kwargs)
-
-                try:
-                    async with session.request(method, url, **kwargs) as response:
-                        response.raise_for_status()
-                        parsed_response = await response.json()
-
-                        if parsed_response.get("status_code") == "40302":
-                            skip_auth = False
-                            auth_success = await self.auth()
-                            if not auth_success:
-                                raise AuthenticationError("Authentication failed. Unable to proceed with the request.")
-                            retries -= 1
-                            continue # Retry the request
-                        if parsed_response.get("status_code") == "50000":
-                            raise APIError(f"Internal server error: {parsed_response.get('status_message')}")
-                        if parsed_response.get("status_code") == "20000" and parsed_response.get("status_message") == "ok":
-                            return parsed_response
-                        else:
-                            raise APIError(f"API request failed {method} {url}: {parsed_response.get('status_message')}")
-                except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError) as e:
-                    _LOGGER.error(f"Client error: {e}")
-                    raise APIError(f"API request failed {method} {url}") from e
+        session = await self._get_session()
+        params = kwargs.pop("params", None)
+        # Conditional GET: replay the cached result when the server answers 304
+        cache_key = (url, tuple(params.items()) if params else None) if method == "GET" else None
+        cached = self._etag_cache.get(cache_key) if cache_key else None
+        headers = {**_REQUEST_HEADERS, "If-None-Match": cached[0]} if cached else _REQUEST_HEADERS
+        for attempt in range(retries):
+            if not self.token and not url.path.endswith("sign_in.json") or not skip_auth:
+                auth_success = await self.auth()
+                if not auth_success:
+                    raise AuthenticationError("Authentication failed. Unable to proceed with the request.")
+
+            request_url = url
+            if params is not None:
+                # Add the session key only now, so a re-auth is picked up on retry
+                request_url = url.with_query({
+                    key: value
+                    for key, value in {**params, "terminal_user_session_key": self.token}.items()
+                    if value is not None
+                })
+
+            try:
+                async with self._fetch_sem, session.request(
+                    method, request_url, headers=headers, timeout=_REQUEST_TIMEOUT, raise_for_status=True, **kwargs
+                ) as response:
+                    if response.status == 304 and cached:
+                        return cached[1]
+                    if not self._logged_encoding:
+                        _LOGGER.debug("Renpho API Content-Encoding: %s", response.headers.get('Content-Encoding'))
+                        self._logged_encoding = True
+                    parsed_response = await response.json(loads=orjson.loads)
+                    etag = response.headers.get("ETag")
+            except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError) as e:
+                if self._is_recoverable(e) and attempt < retries - 1:
+                    _LOGGER.warning("Transient error on %s %s, retrying: %s", method, url, e)
+                    await self._sleep_backoff(attempt)
+                    continue
+                _LOGGER.error("Client error: %s", e)
+                raise APIError(f"API request failed {method} {url}") from e
+
+            # The response is released by now, so re-auth and backoff hold
+            # neither a semaphore slot nor a pooled connection
+            status_code = parsed_response.get("status_code")
+            if status_code == "40302":
+                skip_auth = False
+                auth_success = await self.auth()
+                if not auth_success:
+                    raise AuthenticationError("Authentication failed. Unable to proceed with the request.")
+                await self._sleep_backoff(attempt)
+                continue # Retry the request
+            handler = _STATUS_HANDLERS.get(status_code, _status_unknown)
+            result = handler(parsed_response, method, url)
+            if cache_key and etag:
+                self._etag_cache[cache_key] = (etag, result)
+            return result
+
+    @staticmethod
+    def _is_recoverable(error: Exception) -> bool:
+        """
+        Return True for errors worth retrying: connection failures, 429 and 5xx responses.
+        """
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status == 429 or error.status >= 500
+        return isinstance(error, aiohttp.ClientConnectionError)
+
+    @staticmethod
+    async def _sleep_backoff(attempt: int, base: float = 1.0, cap: float = 30.0, jitter: float = 0.5):
+        """
+        Sleep for an exponentially growing, jittered delay before a retry.
+
+        Parameters:
+            attempt (int): Zero-based index of the attempt that just failed.
+            base (float, optional): Delay for the first retry in seconds. Defaults to 1.0.
+            cap (float, optional): Upper bound for the delay in seconds. Defaults to 30.0.
+            jitter (float, optional): Relative random spread applied to the delay. Defaults to 0.5.
+        """
+        delay = min(cap, base * (2 ** attempt)) * (1 + random.uniform(-jitter, jitter))
+        await asyncio.sleep(max(0, delay))
 
     @staticmethod
-    def encrypt_password(public_key_str, password):
+    def encrypt_password(public_key, password):
         try:
-            rsa_key = RSA.importKey(public_key_str)
-            cipher = PKCS1_v1_5.new(rsa_key)
-            return b64encode(cipher.encrypt(password.encode("utf-8"))).decode("utf-8")
+            ciphertext = public_key.encrypt(password.encode("utf-8"), _PKCS1V15)
+            return b64encode(ciphertext).decode("utf-8")
         except Exception as e:
-            _LOGGER.error(f"Encryption error: {e}")
+            _LOGGER.error("Encryption error: %s", e)
             raise
 
     async def is_valid_session(self):
@@ -221,24 +365,36 @@ class RenphoWeight:
 
 
     async def auth(self):
-        """Authenticate with the Renpho API."""
+        """Authenticate with the Renpho API.
 
-        if self.auth_in_progress:
-            return False  # Avoid re-entry if already in progress
+        Concurrent callers wait for the login already in progress and share
+        its token instead of signing in again.
+        """
+        if self._auth_lock.locked():
+            async with self._auth_lock:
+                return self.token is not None
 
-        self.auth_in_progress = True
+        async with self._auth_lock:
+            return await self._auth()
 
+    async def _auth(self):
+        """Sign in and store the session token; callers hold _auth_lock."""
         if not self.email or not self.password:
             raise AuthenticationError("Email and password are required for authentication.")
 
-        if self.public_key is None:
-            _LOGGER.error("Public key is None.")
-            raise AuthenticationError("Public key is None.")
-
-        encrypted_password = self.encrypt_password(self.public_key, self.password)
+        # RSA encryption is the costly part of a login; only redo it when the password changes
+        if self._encrypted_password is None or self._encrypted_for != self.password:
+            self._encrypted_password = self.encrypt_password(get_public_key(), self.password)
+            self._encrypted_for = self.password
+            self._auth_body = None
+        encrypted_password = self._encrypted_password
 
-        data = self.prepare_data({"secure_flag": "1", "email": self.email,
+        # The sign-in body only depends on the email and encrypted password, so serialize it once
+        if self._auth_body is None or self._auth_body_email != self.email:
+            self._auth_body = orjson.dumps({"secure_flag": "1", "email": self.email,
                 "password": encrypted_password})
+            self._auth_body_email = self.email
+        data = self._auth_body
 
         for attempt in range(3):
             try:
@@ -247,66 +403,58 @@ class RenphoWeight:
                     _LOGGER.error("Proxy check failed. Aborting authentication.")
                     raise APIError("Proxy check failed. Aborting authentication.")
                 
-                connector = ProxyConnector.from_url(self.proxy) if self.proxy else None
-                async with aiohttp.ClientSession(connector=connector, headers={
-                                "Content-Type": "application/json",
-                                "Accept": "application/json",
-                                "User-Agent": "Renpho/2.1.0 (iPhone; iOS 14.4; Scale/2.1.0; en-US)"
-                            }, timeout=ClientTimeout(total=60)) as session:
-
-                    async with session.request("POST", API_AUTH_URL, json=data) as response:
-                        response.raise_for_status()
-                        parsed = await response.json()
-
-                        if parsed is None:
-                            _LOGGER.error("Authentication failed. No response received.")
-                            raise AuthenticationError("Authentication failed. No response received.")
-
-                        if parsed.get("status_code") == "50000" and parsed.get("status_message") == "Email was not registered":
-                            _LOGGER.warning("Email was not registered.")
-                            raise AuthenticationError("Email was not registered.")
-
-                        if parsed.get("status_code") == "500" and parsed.get("status_message") == "Internal Server Error":
-                            _LOGGER.warning("Bad Password or Internal Server Error.")
-                            raise AuthenticationError("Bad Password or Internal Server Error.")
-
-                        if "terminal_user_session_key" not in parsed:
-                            _LOGGER.error(
-                                "'terminal_user_session_key' not found in parsed object.")
-                            raise AuthenticationError(f"Authentication failed: {parsed}")
-
-                        if parsed.get("status_code") == "20000" and parsed.get("status_message") == "ok":
-                            if 'terminal_user_session_key' in parsed:
-                                self.token = parsed["terminal_user_session_key"]
-                            else:
-                                self.token = None
-                                raise AuthenticationError("Session key not found in response.")
-                            if 'device_binds_ary' in parsed:
-                                parsed['device_binds_ary'] = [DeviceBind(**device) for device in parsed['device_binds_ary']]
-                            else:
-                                parsed['device_binds_ary'] = []
-                            self.login_data = UserResponse(**parsed)
+                session = await self._get_session()
+                async with session.request(
+                    "POST", API_AUTH_URL, data=data, headers=_REQUEST_HEADERS, timeout=_REQUEST_TIMEOUT, raise_for_status=True
+                ) as response:
+                    parsed = await response.json(loads=orjson.loads)
+
+                    if parsed is None:
+                        _LOGGER.error("Authentication failed. No response received.")
+                        raise AuthenticationError("Authentication failed. No response received.")
+
+                    if parsed.get("status_code") == "50000" and parsed.get("status_message") == "Email was not registered":
+                        _LOGGER.warning("Email was not registered.")
+                        raise AuthenticationError("Email was not registered.")
+
+                    if parsed.get("status_code") == "500" and parsed.get("status_message") == "Internal Server Error":
+                        _LOGGER.warning("Bad Password or Internal Server Error.")
+                        raise AuthenticationError("Bad Password or Internal Server Error.")
+
+                    if "terminal_user_session_key" not in parsed:
+                        _LOGGER.error(
+                            "'terminal_user_session_key' not found in parsed object.")
+                        raise AuthenticationError(f"Authentication failed: {parsed}")
+
+                    if parsed.get("status_code") == "20000" and parsed.get("status_message") == "ok":
+                        if 'terminal_user_session_key' in parsed:
                             self.token = parsed["terminal_user_session_key"]
-                            if self.user_id is None:
-                                self.user_id = self.login_data.get("id", None)
-                            return True
+                        else:
+                            self.token = None
+                            raise AuthenticationError("Session key not found in response.")
+                        if 'device_binds_ary' in parsed:
+                            parsed['device_binds_ary'] = _DEVICES_ADAPTER.validate_python(parsed['device_binds_ary'])
+                        else:
+                            parsed['device_binds_ary'] = []
+                        self.login_data = UserResponse(**parsed)
+                        self.token = parsed["terminal_user_session_key"]
+                        if self.user_id is None:
+                            self.user_id = self.login_data.get("id", None)
+                        return True
             except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError) as e:
-                _LOGGER.error(f"Authentication failed: {e}")
-                if attempt < 3 - 1:
-                    await asyncio.sleep(5)  # Wait before retrying
+                _LOGGER.error("Authentication failed: %s", e)
+                if self._is_recoverable(e) and attempt < 3 - 1:
+                    await self._sleep_backoff(attempt)
                 else:
                     raise AuthenticationError(f"Authentication failed after retries. {e}") from e
-            finally:
-                self.auth_in_progress = False
 
     async def get_scale_users(self):
         """
         Fetch the list of users associated with the scale.
         """
-        url = f"{API_SCALE_USERS_URL}?locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
         # Perform the API request
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", API_SCALE_USERS_URL, skip_auth=True, params=self._common_params)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch scale users.")
@@ -322,23 +470,24 @@ class RenphoWeight:
             # Check if the response is valid and contains 'scale_users'
             if "scale_users" in parsed:
                 # Update the 'users' attribute with parsed and validated ScaleUser objects
-                self.users = [Users(**user) for user in parsed["scale_users"]]
+                self.users = _USERS_ADAPTER.validate_python(parsed["scale_users"])
             else:
                 _LOGGER.error("Failed to fetch scale users or no scale users found in the response.")
 
-            self.user_id = self.users[0].user_id
+            if self.users:
+                self.user_id = self.users[0].user_id
             return self.users
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch scale users: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to fetch scale users: %s", e)
             return []
 
     async def get_measurements(self):
         """
         Fetch the most recent weight measurements for the user.
         """
-        url = f"{API_MEASUREMENTS_URL}?user_id={self.user_id}&last_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        params = {**self._common_params, "user_id": self.user_id, "last_at": _EPOCH_TS}
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", API_MEASUREMENTS_URL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch weight measurements.")
@@ -349,7 +498,7 @@ class RenphoWeight:
                     _LOGGER.error("No weight measurements found in the response.")
                     return
                 if measurements := parsed["last_ary"]:
-                    self.weight_history = [MeasurementDetail(**measurement) for measurement in measurements]
+                    self.weight_history = _MEASUREMENTS_ADAPTER.validate_python(measurements)
                     self.weight_info = self.weight_history[0] if self.weight_history else None
                     self.weight = self.weight_info.weight if self.weight_info else None
                     self.time_stamp = self.weight_info.time_stamp if self.weight_info else None
@@ -363,11 +512,11 @@ class RenphoWeight:
                 if "status_code" not in parsed:
                     _LOGGER.error("Invalid response format received from weight measurements endpoint.")
                 else:
-                    _LOGGER.error(f"Error fetching weight measurements: Status Code {parsed.get('status_code')} - {parsed.get('status_message')}")
+                    _LOGGER.error("Error fetching weight measurements: Status Code %s - %s", parsed.get('status_code'), parsed.get('status_message'))
                 return None
 
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch weight measurements: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to fetch weight measurements: %s", e)
             return None
 
     async def get_weight(self):
@@ -384,9 +533,9 @@ class RenphoWeight:
         """
         Fetch device information and update the class attribute with device bind details.
         """
-        url = f"{DEVICE_INFO_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        params = {**self._common_params, "user_id": self.user_id, "last_updated_at": _EPOCH_TS}
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", DEVICE_INFO_URL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch device info.")
@@ -394,7 +543,7 @@ class RenphoWeight:
 
             # Check for successful response code
             if parsed.get("status_code") == "20000" and "device_binds_ary" in parsed:
-                device_info = [DeviceBind(**device) for device in parsed["device_binds_ary"]]
+                device_info = _DEVICES_ADAPTER.validate_python(parsed["device_binds_ary"])
                 self.device_info = device_info
                 return device_info
             else:
@@ -402,19 +551,24 @@ class RenphoWeight:
                 if "status_code" not in parsed:
                     _LOGGER.error("Invalid response format received from device info endpoint.")
                 else:
-                    _LOGGER.error(f"Error fetching device info: Status Code {parsed.get('status_code')} - {parsed.get('status_message')}")
+                    _LOGGER.error("Error fetching device info: Status Code %s - %s", parsed.get('status_code'), parsed.get('status_message'))
                 return None
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch device info: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to fetch device info: %s", e)
             return None
 
     async def list_latest_model(self):
         """
         Fetch the latest model for the user.
         """
-        url = f"{LATEST_MODEL_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}$internal_model_json=%5B%22{self.weight_info.internal_model}%22%5D"
+        params = {
+            **self._common_params,
+            "user_id": self.user_id,
+            "last_updated_at": _EPOCH_TS,
+            "internal_model_json": json.dumps([self.weight_info.internal_model]),
+        }
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", LATEST_MODEL_URL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch latest model.")
@@ -424,16 +578,49 @@ class RenphoWeight:
                 self.latest_model = parsed
                 return parsed
             else:
-                _LOGGER.error(f"Error fetching latest model: {parsed.get('status_message')}")
+                _LOGGER.error("Error fetching latest model: %s", parsed.get('status_message'))
                 return None
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch latest model: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to fetch latest model: %s", e)
             return None
 
+    @staticmethod
+    def _latest_girth_values(girths) -> Dict[str, float]:
+        """
+        Map each girth metric to its most recent non-zero value in a single pass.
+        """
+        latest: Dict[str, float] = {}
+        newest_at: Dict[str, int] = {}
+        for girth in girths:
+            for field in _GIRTH_VALUE_FIELDS:
+                value = getattr(girth, field, None)
+                if value in (None, 0.0):
+                    continue
+                metric = field[: -len("_value")]
+                if metric not in newest_at or girth.time_stamp > newest_at[metric]:
+                    newest_at[metric] = girth.time_stamp
+                    latest[metric] = value
+        return latest
+
+    @staticmethod
+    def _latest_girth_goal_values(goals) -> Dict[str, float]:
+        """
+        Map each girth type to the goal value of its most recently set up goal.
+        """
+        latest: Dict[str, float] = {}
+        newest_at: Dict[str, int] = {}
+        for goal in goals:
+            if goal.goal_value in (None, 0.0):
+                continue
+            if goal.girth_type not in newest_at or goal.setup_goal_at > newest_at[goal.girth_type]:
+                newest_at[goal.girth_type] = goal.setup_goal_at
+                latest[goal.girth_type] = goal.goal_value
+        return latest
+
     async def list_girth(self):
-        url = f"{GIRTH_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        params = {**self._common_params, "user_id": self.user_id, "last_updated_at": _EPOCH_TS}
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", GIRTH_URL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch girth info.")
@@ -443,22 +630,23 @@ class RenphoWeight:
                 response = GirthResponse(**parsed)
                 self._last_updated_girth = time.time()
                 self.girth_info = response.girths
+                self._latest_girth_by_metric = self._latest_girth_values(self.girth_info)
                 return self.girth_info
             else:
-                _LOGGER.error(f"Error fetching girth info: {parsed.get('status_message')}")
+                _LOGGER.error("Error fetching girth info: %s", parsed.get('status_message'))
                 return None
 
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch girth info: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to fetch girth info: %s", e)
             return None
 
     async def list_girth_goal(self):
         """
         Fetch the girth goal for the user.
         """
-        url = f"{GIRTH_GOAL_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        params = {**self._common_params, "user_id": self.user_id, "last_updated_at": _EPOCH_TS}
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", GIRTH_GOAL_URL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch girth goal.")
@@ -467,13 +655,14 @@ class RenphoWeight:
             if "status_code" in parsed and parsed["status_code"] == "20000":
                 response = GirthGoalsResponse(**parsed)
                 self.girth_goal = response.girth_goals
+                self._latest_girth_goal_by_type = self._latest_girth_goal_values(self.girth_goal)
                 self._last_updated_girth_goal = time.time()
                 return self.girth_goal
             else:
-                _LOGGER.error(f"Error fetching girth goal: {parsed.get('status_message')}")
+                _LOGGER.error("Error fetching girth goal: %s", parsed.get('status_message'))
                 return None
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch girth goal: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to fetch girth goal: %s", e)
             return None
 
     async def list_growth_record(self):
@@ -481,9 +670,9 @@ class RenphoWeight:
         Fetch the growth record for the user.
         """
 
-        url = f"{GROWTH_RECORD_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        params = {**self._common_params, "user_id": self.user_id, "last_updated_at": _EPOCH_TS}
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", GROWTH_RECORD_URL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch growth record.")
@@ -494,19 +683,19 @@ class RenphoWeight:
                 self._last_updated_growth_record = time.time()
                 return parsed
             else:
-                _LOGGER.error(f"Error fetching growth record: {parsed.get('status_message')}")
+                _LOGGER.error("Error fetching growth record: %s", parsed.get('status_message'))
                 return None
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch growth record: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to fetch growth record: %s", e)
             return None
 
     async def message_list(self):
         """
         Asynchronously list messages.
         """
-        url = f"{MESSAGE_LIST_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        params = {**self._common_params, "user_id": self.user_id, "last_updated_at": _EPOCH_TS}
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", MESSAGE_LIST_URL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch messages.")
@@ -514,19 +703,19 @@ class RenphoWeight:
 
             if "status_code" in parsed and parsed["status_code"] == "20000":
                 return parsed
-            _LOGGER.error(f"Error fetching messages: {parsed.get('status_message')}")
+            _LOGGER.error("Error fetching messages: %s", parsed.get('status_message'))
             return None
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch messages: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to fetch messages: %s", e)
             return None
 
     async def request_user(self):
         """
         Asynchronously request user
         """
-        url = f"{USER_REQUEST_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        params = {**self._common_params, "user_id": self.user_id, "last_updated_at": _EPOCH_TS}
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", USER_REQUEST_URL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to request user.")
@@ -534,10 +723,10 @@ class RenphoWeight:
 
             if "status_code" in parsed and parsed["status_code"] == "20000":
                 return parsed
-            _LOGGER.error(f"Error requesting user: {parsed.get('status_message')}")
+            _LOGGER.error("Error requesting user: %s", parsed.get('status_message'))
             return None
-        except Exception as e:
-            _LOGGER.error(f"Failed to request user: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to request user: %s", e)
             return None
 
     async def reach_goal(self):
@@ -545,9 +734,9 @@ class RenphoWeight:
         Asynchronously reach goal
         """
 
-        url = f"{USERS_REACH_GOAL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        params = {**self._common_params, "user_id": self.user_id, "last_updated_at": _EPOCH_TS}
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", USERS_REACH_GOAL, skip_auth=True, params=params)
 
             if not parsed:
                 _LOGGER.error("Failed to reach goal.")
@@ -555,10 +744,10 @@ class RenphoWeight:
 
             if "status_code" in parsed and parsed["status_code"] == "20000":
                 return parsed
-            _LOGGER.error(f"Error reaching goal: {parsed.get('status_message')}")
+            _LOGGER.error("Error reaching goal: %s", parsed.get('status_message'))
             return None
-        except Exception as e:
-            _LOGGER.error(f"Failed to reach goal: {e}")
+        except _FETCH_ERRORS as e:
+            _LOGGER.error("Failed to reach goal: %s", e)
             return None
 
     async def get_specific_metric(self, metric_type: str, metric: str, user_id: Optional[str] = None):
@@ -585,90 +774,43 @@ class RenphoWeight:
                 if self._last_updated_girth is None or self.girth_info is None:
                     await self.list_girth()
                 if self.girth_info:
-                    valid_girths = sorted([g for g in self.girth_info if getattr(g, f"{metric}_value", 0) not in (None, 0.0)], key=lambda x: x.time_stamp, reverse=True)
-                    for girth in valid_girths:
-                        value = getattr(girth, f"{metric}_value", None)
-                        if value not in (None, 0.0):
-                            return value
-                    return None
+                    return self._latest_girth_by_metric.get(metric)
             elif metric_type == METRIC_TYPE_GIRTH_GOAL:
                 if self._last_updated_girth_goal is None or self.girth_goal is None:
                     await self.list_girth_goal()
                 if self.girth_goal:
-                    valid_goals = sorted([g for g in self.girth_goal if g.girth_type == metric and g.goal_value not in (None, 0.0)], key=lambda x: x.setup_goal_at, reverse=True)
-                    # Iterate to find the first valid goal
-                    for goal in valid_goals:
-                        if goal.goal_value not in (None, 0.0):
-                            return goal.goal_value
-                    return None
+                    return self._latest_girth_goal_by_type.get(metric)
             else:
-                _LOGGER.error(f"Invalid metric type: {metric_type}")
+                _LOGGER.error("Invalid metric type: %s", metric_type)
                 return None
         except Exception as e:
-            _LOGGER.error(f"Failed to fetch specific metric: {e}")
+            _LOGGER.error("Failed to fetch specific metric: %s", e)
             return None
 
-    async def poll_data(self):
-        """
-        The core polling logic that fetches data and processes it.
-        """
-        try:
-            asyncio.gather(
-                await self.get_info(),
-                await self.list_girth(),
-                await self.list_girth_goal(),
-            )
-
-            _LOGGER.info("Data fetched successfully.")
-        except Exception as e:
-            _LOGGER.error(f"Error fetching data: {e}")
-
-    async def start_polling(self):
+    def cached_metric(self, metric_type: str, metric: str):
         """
-        Start the polling process.
-        """
-        if self.is_polling_active:
-            _LOGGER.warning("Polling is already active.")
-            return
-
-        self.is_polling_active = True
-        self.polling_task = asyncio.create_task(self.polling_loop())
+        Return a metric from the last fetched data without calling the API.
 
-    async def polling_loop(self):
-        """
-        The polling loop that runs until is_polling_active is False.
-        """
-        try:
-            while self.is_polling_active:
-                await self.poll_data()
-                await asyncio.sleep(self.refresh_interval)
-        except asyncio.CancelledError:
-            _LOGGER.info("Polling task was cancelled.")
-        except Exception as e:
-            _LOGGER.error(f"Unexpected error in polling loop: {e}")
-        finally:
-            _LOGGER.info("Polling loop exited.")
-
-    def stop_polling(self):
-        """
-        Stop the polling process.
-        """
-        if not self.is_polling_active:
-            _LOGGER.warning("Polling is not active.")
-            return
-
-        if self.polling_task:
-            self.polling_task.cancel()
-            _LOGGER.info("Polling has been stopped.")
-            self.is_polling_active = False
-            self.polling_task = None
+        Parameters:
+            metric_type (str): The type of metric to look up.
+            metric (str): The specific metric to look up.
+        """
+        if metric_type == METRIC_TYPE_WEIGHT:
+            return self.weight_info.get(metric, None) if self.weight_info else None
+        if metric_type == METRIC_TYPE_GIRTH:
+            return self._latest_girth_by_metric.get(metric)
+        if metric_type == METRIC_TYPE_GIRTH_GOAL:
+            return self._latest_girth_goal_by_type.get(metric)
+        _LOGGER.error("Invalid metric type: %s", metric_type)
+        return None
 
     async def close(self):
         """
-        Clean up resources, stop polling, and close sessions.
+        Clean up resources: cancel in-flight requests and close sessions.
         """
-        self.stop_polling()
-        if self.session:
+        for task in list(self._in_flight.values()):
+            task.cancel()
+        if self.session and self._owns_session:
             await self.session.close()
             _LOGGER.info("Aiohttp session closed")
 
@@ -682,3 +824,35 @@ class APIError(Exception):
 
 class ClientSSLError(Exception):
     pass
+
+
+# Errors a fetch logs and recovers from; anything else (including
+# cancellation) propagates to the caller
+_FETCH_ERRORS: Final = (
+    APIError,
+    AuthenticationError,
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+    ValidationError,
+)
+
+
+def _status_ok(parsed, method, url):
+    if parsed.get("status_message") == "ok":
+        return parsed
+    return _status_unknown(parsed, method, url)
+
+
+def _status_server_error(parsed, method, url):
+    raise APIError(f"Internal server error: {parsed.get('status_message')}")
+
+
+def _status_unknown(parsed, method, url):
+    raise APIError(f"API request failed {method} {url}: {parsed.get('status_message')}")
+
+
+# Response status_code -> handler; 40302 (session expired) is retried in _send_request
+_STATUS_HANDLERS: Final = {
+    "20000": _status_ok,
+    "50000": _status_server_error,
+}
@@ -8,66 +8,71 @@ from homeassistant import config_entries, exceptions
 from homeassistant.core import HomeAssistant
 
 from homeassistant.helpers import translation
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     CONF_EMAIL,
     CONF_PASSWORD,
-    CONF_PUBLIC_KEY,
+    CONF_PROXY,
     CONF_REFRESH,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_USER_ID,
     DOMAIN,
     MASS_KILOGRAMS,
     MASS_POUNDS,
+    MIN_REFRESH_SECONDS,
 )
-from .api_renpho import RenphoWeight
 
 _LOGGER = logging.getLogger(__name__)
 
 DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_EMAIL): str,
     vol.Required(CONF_PASSWORD): str,
-    vol.Optional(CONF_REFRESH, default=60): int,
+    vol.Optional(CONF_REFRESH, default=60): vol.All(int, vol.Clamp(min=MIN_REFRESH_SECONDS)),
     vol.Optional(CONF_UNIT_OF_MEASUREMENT, default=MASS_KILOGRAMS): vol.In([MASS_KILOGRAMS, MASS_POUNDS]),
-    vol.Optional("proxy"): str
+    vol.Optional(CONF_PROXY): str
 })
 
 async def async_validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     _LOGGER.debug("Starting to validate input for Renpho integration: %s", data)
     
+    # Imported here so the client's dependencies only load when a flow runs
+    from .api_renpho import RenphoWeight
+
     # Initialize RenphoWeight instance
     renpho = RenphoWeight(
         email=data[CONF_EMAIL],
         password=data[CONF_PASSWORD],
         refresh=data.get(CONF_REFRESH, 60),
-        proxy=data.get("proxy", None)
+        proxy=data.get(CONF_PROXY),
+        session=None if data.get(CONF_PROXY) else async_get_clientsession(hass),
     )
 
     # Check if a proxy is set and validate it
     if renpho.proxy:
-        _LOGGER.info(f"Proxy is configured, checking proxy: {renpho.proxy}")
+        _LOGGER.info("Proxy is configured, checking proxy: %s", renpho.proxy)
         proxy_is_valid = await renpho.check_proxy()
         if not proxy_is_valid:
-            _LOGGER.error(f"Proxy check failed for proxy: {renpho.proxy}")
+            _LOGGER.error("Proxy check failed for proxy: %s", renpho.proxy)
             raise CannotConnect(reason="Proxy check failed", details={"proxy": renpho.proxy})
         else:
             _LOGGER.info("Proxy check passed successfully.")
     else:
         _LOGGER.info("No proxy configured, skipping proxy check.")
 
-    _LOGGER.info(f"Attempting to validate credentials for {data[CONF_EMAIL]}")
+    _LOGGER.info("Attempting to validate credentials for %s", data[CONF_EMAIL])
     
     # Validate credentials
     is_valid = await renpho.validate_credentials()
     if not is_valid:
-        _LOGGER.error(f"Failed to validate credentials for user: {data[CONF_EMAIL]}. Invalid credentials.")
+        _LOGGER.error("Failed to validate credentials for user: %s. Invalid credentials.", data[CONF_EMAIL])
         raise CannotConnect(
             reason="Invalid credentials",
             details={"email": data[CONF_EMAIL]},
         )
     else:
-        _LOGGER.info(f"Credentials validated successfully for {data[CONF_EMAIL]}")
+        _LOGGER.info("Credentials validated successfully for %s", data[CONF_EMAIL])
 
     # Fetch and validate scale users
     _LOGGER.info("Fetching scale users associated with the account.")
@@ -75,10 +80,10 @@ async def async_validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any
     user_ids = [user.user_id for user in renpho.users if user.user_id is not None]
 
     if not user_ids:
-        _LOGGER.error(f"No users found associated with the account {data[CONF_EMAIL]}")
+        _LOGGER.error("No users found associated with the account %s", data[CONF_EMAIL])
         raise CannotConnect(reason="No users found", details={"email": data[CONF_EMAIL]})
     else:
-        _LOGGER.info(f"Found users with IDs: {user_ids} for the account {data[CONF_EMAIL]}")
+        _LOGGER.info("Found users with IDs: %s for the account %s", user_ids, data[CONF_EMAIL])
 
     return {"title": data[CONF_EMAIL], "user_ids": user_ids, "renpho_instance": renpho}
 
@@ -103,11 +108,11 @@ class RenphoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             except CannotConnect as e:
                 errors["base"] = "cannot_connect"
-                _LOGGER.error(f"Cannot connect due to {e.reason}. Details: {e.get_details()}")
+                _LOGGER.error("Cannot connect due to %s. Details: %s", e.reason, e.get_details())
 
             except Exception as e:  # pylint: disable=broad-except
                 errors["base"] = "unknown_error"
-                _LOGGER.exception(f"Unexpected exception: {e}")
+                _LOGGER.exception("Unexpected exception: %s", e)
 
         return self.async_show_form(
             step_id="user",
@@ -1,9 +1,20 @@
 # Constants for the Renpho integration
+from __future__ import annotations
 
 # The domain of the component. Used to store data in hass.data.
-from typing import Final
+import base64
+import re
+import sys
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Final
 
 DOMAIN: Final = "renpho"
+# hass.data key for the user id of the single account configured in YAML
+DATA_YAML_USER_ID: Final = f"{DOMAIN}_yaml_user_id"
 VERSION: Final = "1.0.0"
 EVENT_HOMEASSISTANT_CLOSE: Final = "homeassistant_close"
 EVENT_HOMEASSISTANT_START: Final = "homeassistant_start"
@@ -23,51 +34,69 @@ CONF_USER_ID: Final = (
     "user_id"  # The ID of the user for whom weight data should be fetched
 )
 CONF_UNIT_OF_MEASUREMENT = "unit_of_measurement"
+CONF_PROXY: Final = "proxy"  # Optional proxy URL for reaching the Renpho API
+
+# Shortest refresh interval accepted; the scale only reports a few times a day
+MIN_REFRESH_SECONDS: Final = 30
 
 KG_TO_LBS: Final = 2.2046226218
 CM_TO_INCH: Final = 0.393701
 
+
+@dataclass(frozen=True, slots=True)
+class _Conversions:
+    """Unit conversion factors grouped behind a single slotted object."""
+
+    kg_to_lbs: float = KG_TO_LBS
+    cm_to_inch: float = CM_TO_INCH
+
+
+CONV: Final = _Conversions()
+
+# Metric keys are interned so dict lookups against parsed payloads can
+# short-circuit on identity
+
 # General Information Metrics
-ID: Final = "id"
-B_USER_ID: Final = "b_user_id"
-TIME_STAMP: Final = "time_stamp"
-CREATED_AT: Final = "created_at"
-CREATED_STAMP: Final = "created_stamp"
+ID: Final = sys.intern("id")
+B_USER_ID: Final = sys.intern("b_user_id")
+TIME_STAMP: Final = sys.intern("time_stamp")
+CREATED_AT: Final = sys.intern("created_at")
+CREATED_STAMP: Final = sys.intern("created_stamp")
 
 # Device Information Metrics
-SCALE_TYPE: Final = "scale_type"
-SCALE_NAME: Final = "scale_name"
-MAC: Final = "mac"
-INTERNAL_MODEL: Final = "internal_model"
-TIME_ZONE: Final = "time_zone"
+SCALE_TYPE: Final = sys.intern("scale_type")
+SCALE_NAME: Final = sys.intern("scale_name")
+MAC: Final = sys.intern("mac")
+INTERNAL_MODEL: Final = sys.intern("internal_model")
+TIME_ZONE: Final = sys.intern("time_zone")
 
 # User Profile Metrics
-GENDER: Final = "gender"
-HEIGHT: Final = "height"
-HEIGHT_UNIT: Final = "height_unit"
-BIRTHDAY: Final = "birthday"
+GENDER: Final = sys.intern("gender")
+HEIGHT: Final = sys.intern("height")
+HEIGHT_UNIT: Final = sys.intern("height_unit")
+BIRTHDAY: Final = sys.intern("birthday")
 
 # Physical Metrics
-WEIGHT: Final = "weight"
-BMI: Final = "bmi"
-MUSCLE: Final = "muscle"
-BONE: Final = "bone"
-WAISTLINE: Final = "waistline"
-HIP: Final = "hip"
-STATURE: Final = "stature"
+WEIGHT: Final = sys.intern("weight")
+BMI: Final = sys.intern("bmi")
+MUSCLE: Final = sys.intern("muscle")
+BONE: Final = sys.intern("bone")
+WAISTLINE: Final = sys.intern("waistline")
+HIP: Final = sys.intern("hip")
+STATURE: Final = sys.intern("stature")
 
 # Body Composition Metrics
-BODYFAT: Final = "bodyfat"
-WATER: Final = "water"
-SUBFAT: Final = "subfat"
-VISFAT: Final = "visfat"
+BODYFAT: Final = sys.intern("bodyfat")
+WATER: Final = sys.intern("water")
+SUBFAT: Final = sys.intern("subfat")
+VISFAT: Final = sys.intern("visfat")
 
 # Metabolic Metrics
-BMR: Final = "bmr"
-PROTEIN: Final = "protein"
+BMR: Final = sys.intern("bmr")
+PROTEIN: Final = sys.intern("protein")
 
 # Age Metrics
-BODYAGE: Final = "bodyage"
+BODYAGE: Final = sys.intern("bodyage")
 
 GIRTH_METRICS: Final = [
     "neck_value",
@@ -131,9 +160,34 @@ METRIC_TYPE = [
 ]
 
 # Public key for encrypting the password
-CONF_PUBLIC_KEY: Final = """-----BEGIN PUBLIC KEY-----
+CONF_PUBLIC_KEY: Final[bytes] = b"""-----BEGIN PUBLIC KEY-----
 MIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQC+25I2upukpfQ7rIaaTZtVE744
 u2zV+HaagrUhDOTq8fMVf9yFQvEZh2/HKxFudUxP0dXUa8F6X4XmWumHdQnum3zm
 Jr04fz2b2WCcN0ta/rbF2nYAnMVAk2OJVZAMudOiMWhcxV1nNJiKgTNNr13de0EQ
 IiOL2CUBzu+HmIfUbQIDAQAB
------END PUBLIC KEY-----"""
+-----END PUBLIC KEY-----
+"""
+
+_PEM_STRIP_RE: Final = re.compile(rb"-----[^-]+-----|\s+")
+
+
+@cache
+def pubkey_der() -> bytes:
+    """Return the DER bytes decoded from the PEM public key.
+
+    The PEM block above is the only copy of the key; loading from DER skips
+    the PEM framing in the parser.
+    """
+    return base64.b64decode(_PEM_STRIP_RE.sub(b"", CONF_PUBLIC_KEY))
+
+
+@cache
+def get_public_key():
+    """Return the parsed RSA public key, loading it on the first call.
+
+    Parsed lazily so Home Assistant startup does not pay for it.
+    """
+    from cryptography.hazmat.primitives.serialization import load_der_public_key
+
+    return load_der_public_key(pubkey_der())
+
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from datetime import datetime, timedelta
 import logging
 
@@ -27,26 +29,36 @@ class RenphoWeightCoordinator(DataUpdateCoordinator):
         self.api = api
         self.config = config
         self.hass = hass
-        self._unit_of_measurement = hass.data[CONF_UNIT_OF_MEASUREMENT]
-        self._user_id = hass.data[CONF_USER_ID]
-        self._refresh = hass.data[CONF_REFRESH]
-        self._email = hass.data[CONF_EMAIL]
+        self._unit_of_measurement = config[CONF_UNIT_OF_MEASUREMENT]
+        self._user_id = config.get(CONF_USER_ID)
+        self._refresh = config[CONF_REFRESH]
+        self._email = config[CONF_EMAIL]
         self._data = {}
         self._last_updated = None
 
+        # Only notify the sensors when a poll actually brings new data
         super().__init__(
-            hass, _LOGGER, name=DOMAIN, update_interval=timedelta(seconds=self._refresh)
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=self._refresh),
+            always_update=False,
         )
 
     async def _async_update_data(self):
         """Fetch data from API."""
         try:
             with async_timeout.timeout(self._refresh):
-                await self.api.get_measurements()
-                await self.api.list_girth()
-                await self.api.list_girth_goal()
+                # Independent endpoints; a missing token is handled once by auth()'s lock
+                await asyncio.gather(
+                    self.api.get_measurements(),
+                    self.api.list_girth(),
+                    self.api.list_girth_goal(),
+                )
 
             self._last_updated = datetime.now()
+            # Comparable snapshot so unchanged polls do not wake the listeners
+            return (self.api.weight_info, self.api.girth_info, self.api.girth_goal)
         except asyncio.TimeoutError:
             _LOGGER.error("Timeout error fetching data from Renpho API.")
             raise UpdateFailed("Timeout error occurred while fetching data.")
@@ -54,7 +66,7 @@ class RenphoWeightCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Task was cancelled, possibly during shutdown.")
             # Don't raise UpdateFailed for CancelledError as it's a normal part of operation
         except Exception as e:
-            _LOGGER.error(f"Error fetching data from Renpho API: {e}")
+            _LOGGER.error("Error fetching data from Renpho API: %s", e)
             raise UpdateFailed(f"Error fetching data: {e}") from e
 
     @property
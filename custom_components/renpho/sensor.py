@@ -2,39 +2,43 @@
 
 from __future__ import annotations
 import asyncio
+import logging
 
 from datetime import datetime
 
-from .coordinator import create_coordinator
 import warnings
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util import slugify
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 warnings.filterwarnings("ignore", message="Setup of sensor platform renpho is taking over 10 seconds.")
 
 from .const import (
     CONF_REFRESH,
     CONF_UNIT_OF_MEASUREMENT,
+    CONF_USER_ID,
+    CONV,
+    DATA_YAML_USER_ID,
     DOMAIN,
-    KG_TO_LBS,
     MASS_KILOGRAMS,
     MASS_POUNDS,
 )
-from .api_renpho import _LOGGER, RenphoWeight
 from .sensor_configs import sensor_configurations
 
+_LOGGER = logging.getLogger(__name__)
+
 
 async def sensors_list(
     hass: HomeAssistant, config_entry: ConfigEntry, coordinator
 ) -> list[RenphoSensor]:
     """Return a list of sensors, initialized with the coordinator."""
     return [
-        RenphoSensor(coordinator, **sensor, unit_of_measurement=hass.data[CONF_UNIT_OF_MEASUREMENT])
+        RenphoSensor(coordinator, **sensor, unit_of_measurement=coordinator.config[CONF_UNIT_OF_MEASUREMENT])
         for sensor in sensor_configurations
     ]
 
@@ -43,15 +47,12 @@ async def async_setup(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ):
-    # Create the coordinator
-    coordinator = create_coordinator(hass, hass.data[DOMAIN], config_entry)
-
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_config_entry_first_refresh()
+    # Reuse the coordinator set up with the client; its first fetch is already under way
+    coordinator = hass.data[DOMAIN][hass.data[DATA_YAML_USER_ID]]
 
     # Create sensor entities and pass them the coordinator
     sensor_entities = await sensors_list(hass, config_entry, coordinator)
-    async_add_entities(sensor_entities, update_before_add=True)
+    async_add_entities(sensor_entities)
 
 
 async def async_setup_entry(
@@ -59,15 +60,12 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ):
-    # Create the coordinator
-    coordinator = create_coordinator(hass, hass.data[DOMAIN], config_entry)
-
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_config_entry_first_refresh()
+    # Reuse the coordinator set up with the client; its first fetch is already under way
+    coordinator = hass.data[DOMAIN][config_entry.data.get(CONF_USER_ID)]
 
     # Create sensor entities and pass them the coordinator
     sensor_entities = await sensors_list(hass, config_entry, coordinator)
-    async_add_entities(sensor_entities, update_before_add=True)
+    async_add_entities(sensor_entities)
 
 
 async def async_setup_platform(
@@ -78,22 +76,19 @@ async def async_setup_platform(
 ):
     """Set up the sensor platform asynchronously."""
     try:
-        # Create the coordinator
-        coordinator = create_coordinator(hass, hass.data[DOMAIN], discovery_info)
-
-        # Fetch initial data so we have data when entities subscribe
-        await coordinator.async_config_entry_first_refresh()
+        # Reuse the coordinator set up with the client; its first fetch is already under way
+        coordinator = hass.data[DOMAIN][config.get(CONF_USER_ID) or hass.data[DATA_YAML_USER_ID]]
 
         # Create sensor entities and pass them the coordinator
         sensor_entities = await sensors_list(hass, config, coordinator)
-        async_add_entities(sensor_entities, update_before_add=True)
+        async_add_entities(sensor_entities)
     except ConnectionError as ex:
-        _LOGGER.error(f"Error: {ex}")
+        _LOGGER.error("Error: %s", ex)
         return False
 
 
 
-class RenphoSensor(SensorEntity):
+class RenphoSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Renpho sensor."""
 
     def __init__(
@@ -108,7 +103,8 @@ class RenphoSensor(SensorEntity):
         unit_of_measurement: str,
     ) -> None:
         """Initialize the sensor with the coordinator."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
+        self._user_id = coordinator.config.get(CONF_USER_ID)
         self._metric = metric
         self._id = id
         self._name = f"Renpho {name}"
@@ -116,25 +112,33 @@ class RenphoSensor(SensorEntity):
         self._category = category
         self._label = label
         self._unit_of_measurement = unit_of_measurement
+        # Resolve the unit conversion once instead of on every update:
+        # a multiplier for kg-based sensors, None to pass values through
+        if unit == MASS_KILOGRAMS:
+            self._scale = CONV.kg_to_lbs if unit_of_measurement == MASS_POUNDS else 1.0
+        else:
+            self._scale = None
         self._state = None
         self._timestamp = None
 
-        self.async_on_remove(
-            coordinator.async_add_listener(self._schedule_update)
-        )
+    async def async_added_to_hass(self) -> None:
+        """Fill in the state if the coordinator fetched before the sensor was added."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._update_from_coordinator()
 
-    def _schedule_update(self):
-        """Schedule an update of the coordinator."""
-        self.hass.async_add_job(self._handle_coordinator_update)
-
-    async def _handle_coordinator_update(self):
+    @callback
+    def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        await self.async_update()
+        self._update_from_coordinator()
         self.async_write_ha_state()
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
+        # Scoped by user so sensors of different accounts do not collide
+        if self._user_id:
+            return f"renpho_{self._user_id}_{slugify(self._name)}"
         return f"renpho_{slugify(self._name)}"
 
     @property
@@ -198,33 +202,24 @@ class RenphoSensor(SensorEntity):
         """Return the current state of the sensor."""
         return self._state 
 
-    async def async_update(self):
-        """Request an immediate update of the coordinator data."""
+    def _update_from_coordinator(self) -> None:
+        """Read the metric from the data the coordinator last fetched."""
         try:
-            metric_value = await self.coordinator.api.get_specific_metric(
+            metric_value = self.coordinator.api.cached_metric(
                 metric_type=self._metric,
                 metric=self._id,
-                user_id=None
             )
 
             if metric_value is not None:
-                if self._unit_of_measurement == MASS_POUNDS and self._unit == MASS_KILOGRAMS:
-                    self._state = round(metric_value * KG_TO_LBS, 2)
-                elif self._unit_of_measurement == MASS_KILOGRAMS and self._unit == MASS_KILOGRAMS:
-                    self._state = round(metric_value, 2)
-                else:
-                    self._state = metric_value
+                scale = self._scale
+                self._state = metric_value if scale is None else round(metric_value * scale, 2)
                 self._timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                _LOGGER.info(f"Successfully updated {self._name} for metric type {self._metric} with value {self._state} with unit {self._unit}")
+                _LOGGER.info("Successfully updated %s for metric type %s with value %s with unit %s", self._name, self._metric, self._state, self._unit)
             else:
                 self._state = None  # You might choose to clear the state or leave it unchanged
 
-        except (ConnectionError, TimeoutError) as e:
-            _LOGGER.error(
-                f"{type(e).__name__} occurred while updating {self._name} for metric type {self._metric}: {e}"
-            )
-
-        except Exception as e:
-            _LOGGER.critical(
-                f"An unexpected error occurred while updating {self._name} for metric type {self._metric}: {e}"
+        except Exception:
+            _LOGGER.exception(
+                "An unexpected error occurred while updating %s for metric type %s",
+                self._name, self._metric,
             )